@@ -2,25 +2,46 @@
 Dynamically build what's new page based on github releases
 """
 
-import requests, re
+import json, os, re, requests, time
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 GITHUB_REPO = "ultraplot/ultraplot"
 OUTPUT_RST = Path("whats_new.rst")
+CACHE_FILE = OUTPUT_RST.parent / ".releases_cache.json"
+CACHE_TTL = float(os.environ.get("UP_RELEASES_TTL", 1800))  # seconds
 
 
 GITHUB_API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases"
 
+# Pattern used when converting the markdown release notes
+_PR_RE = re.compile(r" by @\w+ in (https://github.com/\S+)")
+
+# Reuse one connection across pages and back off on rate limits or server errors
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=2,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(403, 429, 502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    ),
+)
+
 
 def format_release_body(text):
     """Formats GitHub release notes for better RST readability."""
-    lines = text.strip().split("\n")
+    # Convert Markdown ## Headers to RST H2
     formatted = []
-
-    for line in lines:
+    for line in text.strip().split("\n"):
         line = line.strip()
-
-        # Convert Markdown ## Headers to RST H2
         if line.startswith("## "):
             title = line[3:].strip()  # Remove "## " from start
             formatted.append(f"{title}\n{'~' * len(title)}\n")  # RST H2 Format
@@ -28,26 +49,70 @@ def format_release_body(text):
             formatted.append(line)
 
     # Convert PR references (remove "by @user in ..." but keep the link)
-    formatted_text = "\n".join(formatted)
-    formatted_text = re.sub(
-        r" by @\w+ in (https://github.com/[^\s]+)", r" (\1)", formatted_text
-    )
+    return _PR_RE.sub(r" (\1)", "\n".join(formatted)).strip()
+
 
-    return formatted_text.strip()
+def _load_cache():
+    """Loads the cached ETags and page contents and whether they are fresh."""
+    try:
+        age = time.time() - CACHE_FILE.stat().st_mtime
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}, False
+    if not isinstance(cache, dict) or cache.get("repo") != GITHUB_REPO:
+        return {}, False
+    return cache.get("pages", {}), age < CACHE_TTL
+
+
+def _save_cache(cache):
+    """Saves the ETags and page contents for conditional requests."""
+    try:
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"repo": GITHUB_REPO, "pages": cache}, f)
+    except OSError as err:
+        print(f"Could not write releases cache: {err}")
 
 
 def fetch_all_releases():
     """Fetches all GitHub releases across multiple pages."""
     releases = []
     page = 1
+    cache, fresh = _load_cache()
+    if fresh:  # skip the network entirely within the cache lifetime
+        while str(page) in cache and cache[str(page)]["data"]:
+            releases.extend(cache[str(page)]["data"])
+            page += 1
+        return releases
+
+    headers = {"Accept": "application/vnd.github+json"}
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
 
     while True:
-        response = requests.get(GITHUB_API_URL, params={"per_page": 30, "page": page})
-        if response.status_code != 200:
+        # Send the cached ETag so unchanged pages return an empty 304 response
+        cached = cache.get(str(page))
+        page_headers = headers.copy()
+        if cached:
+            page_headers["If-None-Match"] = cached["etag"]
+        response = _SESSION.get(
+            GITHUB_API_URL,
+            params={"per_page": 30, "page": page},
+            headers=page_headers,
+            timeout=10,
+        )
+        if response.status_code == 304 and cached:
+            page_data = cached["data"]
+        elif response.status_code == 200:
+            page_data = response.json()
+            etag = response.headers.get("ETag")
+            if etag:
+                cache[str(page)] = {"etag": etag, "data": page_data}
+        else:
             print(f"Error fetching releases: {response.status_code}")
-            break
+            return releases  # do not cache incomplete results
 
-        page_data = response.json()
         # If the page is empty, stop fetching
         if not page_data:
             break
@@ -55,6 +120,7 @@ def fetch_all_releases():
         releases.extend(page_data)
         page += 1
 
+    _save_cache(cache)
     return releases
 
 
@@ -66,7 +132,7 @@ def fetch_releases():
         return ""
 
     header = "What's new?"
-    rst_content = f".. _whats_new:\n\n{header}\n{'=' * len(header)}\n\n"  # H1
+    parts = [f".. _whats_new:\n\n{header}\n{'=' * len(header)}\n\n"]  # H1
 
     for release in releases:
         # ensure title is formatted as {tag}: {title}
@@ -91,12 +157,12 @@ def fetch_releases():
         body = format_release_body(release["body"] or "")
 
         # Version header (H2)
-        rst_content += f"{title} ({date})\n{'-' * (len(title) + len(date) + 3)}\n\n"
+        parts.append(f"{title} ({date})\n{'-' * (len(title) + len(date) + 3)}\n\n")
 
         # Process body content
-        rst_content += f"{body}\n\n"
+        parts.append(f"{body}\n\n")
 
-    return rst_content
+    return "".join(parts)
 
 
 def write_rst():
@@ -8,7 +8,13 @@ name = "ultraplot"
 try:
     from ._version import __version__
 except ImportError:
-    __version__ = "unknown"
+    # Fall back to installed package metadata, e.g. if _version.py was not written
+    import importlib.metadata as _metadata
+
+    try:
+        __version__ = _metadata.version(name)
+    except _metadata.PackageNotFoundError:
+        __version__ = "unknown"
 
 version = __version__
 
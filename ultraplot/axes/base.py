@@ -1083,26 +1083,28 @@ class Axes(maxes.Axes):
 
         # Build label and locator keyword argument dicts
         # NOTE: This carefully handles the 'maxn' and 'maxn_minor' deprecations
-        kw_label = {}
         locator_kw = locator_kw or {}
         formatter_kw = formatter_kw or {}
         minorlocator_kw = minorlocator_kw or {}
-        for key, value in (
-            ("size", labelsize),
-            ("weight", labelweight),
-            ("color", labelcolor),
-        ):
-            if value is not None:
-                kw_label[key] = value
-        kw_ticklabels = {}
-        for key, value in (
-            ("size", ticklabelsize),
-            ("weight", ticklabelweight),
-            ("color", ticklabelcolor),
-            ("rotation", rotation),
-        ):
-            if value is not None:
-                kw_ticklabels[key] = value
+        kw_label = {
+            key: value
+            for key, value in (
+                ("size", labelsize),
+                ("weight", labelweight),
+                ("color", labelcolor),
+            )
+            if value is not None
+        }
+        kw_ticklabels = {
+            key: value
+            for key, value in (
+                ("size", ticklabelsize),
+                ("weight", ticklabelweight),
+                ("color", ticklabelcolor),
+                ("rotation", rotation),
+            )
+            if value is not None
+        }
         for b, kw in enumerate((locator_kw, minorlocator_kw)):
             key = "maxn_minor" if b else "maxn"
             name = "minorlocator" if b else "locator"
@@ -1141,7 +1143,8 @@ class Axes(maxes.Axes):
         # NOTE: Account for special case where auto colorbar is generated from 1D
         # methods that construct an 'artist list' (i.e. colormap scatter object)
         if (
-            np.iterable(mappable)
+            not isinstance(mappable, mcm.ScalarMappable)
+            and np.iterable(mappable)
             and len(mappable) == 1
             and isinstance(mappable[0], mcm.ScalarMappable)
         ):  # noqa: E501
@@ -1283,13 +1286,14 @@ class Axes(maxes.Axes):
                 axis.set_ticks(centers)
                 ticklenratio = 0
                 tickwidthratio = 0
-        axis.set_tick_params(which="both", color=color, direction=tickdir)
-        axis.set_tick_params(which="major", length=ticklen, width=tickwidth)
+        kw_ticks = {"color": color, "direction": tickdir}
+        axis.set_tick_params(which="major", length=ticklen, width=tickwidth, **kw_ticks)
         axis.set_tick_params(
             which="minor",
             length=ticklen * ticklenratio,
             width=tickwidth * tickwidthratio,
-        )  # noqa: E501
+            **kw_ticks,
+        )
 
         # Set label and label location
         long_or_short_axis = _get_axis_for(
@@ -1311,14 +1315,11 @@ class Axes(maxes.Axes):
 
         long_or_short_axis.label.update(kw_label)
         # Assume ticks are set on the long axis(!))
-        if hasattr(obj, "_long_axis"):
-            # mpl <=3.9
-            longaxis = obj._long_axis()
-        else:
-            # mpl >=3.10
-            longaxis = obj.long_axis
-        for label in longaxis.get_ticklabels():
-            label.update(kw_ticklabels)
+        # NOTE: Here 'axis' is the long axis determined from the orientation above.
+        # NOTE: Skip when empty since get_ticklabels() triggers tick updates.
+        if kw_ticklabels:
+            for label in axis.get_ticklabels():
+                label.update(kw_ticklabels)
         kw_outline = {"edgecolor": color, "linewidth": linewidth}
         if obj.outline is not None:
             obj.outline.update(kw_outline)
@@ -1892,8 +1893,11 @@ class Axes(maxes.Axes):
         """
         # For container objects, we just assume color is the same for every item.
         # Works for ErrorbarContainer, StemContainer, BarContainer.
+        # NOTE: Check colormaps and strings first and test iterability only once.
+        iterable = not isinstance(mappable, (mcolors.Colormap, str))
+        iterable = iterable and np.iterable(mappable)
         if (
-            np.iterable(mappable)
+            iterable
             and len(mappable) > 0
             and all(isinstance(obj, mcontainer.Container) for obj in mappable)
         ):
@@ -1906,14 +1910,14 @@ class Axes(maxes.Axes):
                 values = [None] * cmap.N  # sometimes use discrete norm
 
         # List of colors
-        elif np.iterable(mappable) and all(map(mcolors.is_color_like, mappable)):
+        elif iterable and all(map(mcolors.is_color_like, mappable)):
             cmap = pcolors.DiscreteColormap(list(mappable), "_no_name")
             if values is None:
                 values = [None] * len(mappable)  # always use discrete norm
 
         # List of artists
         # NOTE: Do not check for isinstance(Artist) in case it is an mpl collection
-        elif np.iterable(mappable) and all(
+        elif iterable and all(
             hasattr(obj, "get_color") or hasattr(obj, "get_facecolor")
             for obj in mappable  # noqa: E501
         ):
@@ -1964,15 +1968,16 @@ class Axes(maxes.Axes):
         if values is not None:
             ticks = []
             labels = None
+            strings = False  # track string labels while parsing
             for i, val in enumerate(values):
                 try:
                     val = float(val)
                 except (TypeError, ValueError):
-                    pass
+                    strings = strings or isinstance(val, str)
                 if val is None:
                     val = i
                 ticks.append(val)
-            if any(isinstance(_, str) for _ in ticks):
+            if strings:
                 labels = list(map(str, ticks))
                 ticks = np.arange(len(ticks))
             if len(ticks) == 1:
@@ -172,10 +172,14 @@ def _init_user_folders():
     """
     Initialize .ultraplot folder.
     """
+    # NOTE: Resolve the folder once and attempt mkdir directly rather than
+    # calling user_folder() and isdir() for every subfolder on each import.
+    base = Configurator.user_folder()
     for subfolder in ("", "cmaps", "cycles", "colors", "fonts"):
-        folder = Configurator.user_folder(subfolder)
-        if not os.path.isdir(folder):
-            os.mkdir(folder)
+        try:
+            os.mkdir(os.path.join(base, subfolder))
+        except FileExistsError:
+            pass
 
 
 def _get_data_folders(folder, user=True, local=True, default=True, reverse=False):
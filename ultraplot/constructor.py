@@ -67,6 +67,9 @@ __all__ = [
 DEFAULT_CYCLE_SAMPLES = 10
 DEFAULT_CYCLE_LUMINANCE = 90
 
+# Pattern used to detect new-style format strings passed to Formatter
+REGEX_STRMETHOD = re.compile(r"{x(:.+)?}")
+
 # Normalizer registry
 NORMS = {
     "none": mcolors.NoNorm,
@@ -1265,7 +1268,7 @@ def Formatter(formatter, *args, date=False, index=False, **kwargs):
     if isinstance(formatter, mticker.Formatter):
         return copy.copy(formatter)
     if isinstance(formatter, str):
-        if re.search(r"{x(:.+)?}", formatter):  # str.format
+        if "{x" in formatter and REGEX_STRMETHOD.search(formatter):  # str.format
             formatter = mticker.StrMethodFormatter(formatter, *args, **kwargs)
         elif "%" in formatter:  # str % format
             cls = mdates.DateFormatter if date else mticker.FormatStrFormatter
@@ -31,11 +31,9 @@ def _not_none(*args, default=None, **kwargs):
                 first = arg
                 break
     elif kwargs:
-        for name, arg in list(kwargs.items()):
-            if arg is not None:
-                first = arg
-                break
         kwargs = {name: arg for name, arg in kwargs.items() if arg is not None}
+        if kwargs:
+            first = next(iter(kwargs.values()))
         if len(kwargs) > 1:
             warnings._warn_ultraplot(
                 f"Got conflicting or duplicate keyword arguments: {kwargs}. "
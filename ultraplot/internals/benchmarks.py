@@ -14,13 +14,16 @@ class _benchmark(object):
     Context object for timing arbitrary blocks of code.
     """
 
+    __slots__ = ("message", "time")
+
     def __init__(self, message):
         self.message = message
 
     def __enter__(self):
         if BENCHMARK:
-            self.time = time.perf_counter()
+            self.time = time.perf_counter_ns()
 
     def __exit__(self, *args):  # noqa: U100
         if BENCHMARK:
-            print(f"{self.message}: {time.perf_counter() - self.time}s")
+            elapsed = time.perf_counter_ns() - self.time
+            print(f"{self.message}: {elapsed / 1e9}s")
@@ -38,6 +38,14 @@ def next_release():
     return string
 
 
+@functools.lru_cache(maxsize=256)
+def _is_internal(name):
+    """
+    Return whether the module name belongs to matplotlib or ultraplot.
+    """
+    return bool(REGEX_INTERNAL.match(name))
+
+
 def _warn_ultraplot(message):
     """
     Emit a `UltraPlotWarning` and show the stack level outside of matplotlib and
@@ -46,7 +54,7 @@ def _warn_ultraplot(message):
     frame = sys._getframe()
     stacklevel = 1
     while frame is not None:
-        if not REGEX_INTERNAL.match(frame.f_globals.get("__name__", "")):
+        if not _is_internal(frame.f_globals.get("__name__", "")):
             break  # this is the first external frame
         frame = frame.f_back
         stacklevel += 1
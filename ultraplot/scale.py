@@ -3,6 +3,7 @@
 Various axis `~matplotlib.scale.ScaleBase` classes.
 """
 import copy
+from functools import cached_property
 
 import matplotlib.scale as mscale
 import matplotlib.ticker as mticker
@@ -29,6 +30,17 @@ __all__ = [
 ]
 
 
+def _apply_inplace(ufunc, a):
+    """
+    Apply the unary ufunc to a temporary array in place. Scalars returned by
+    ufuncs on zero-dimensional input do not support the `out` argument, and
+    masked arrays check the ufunc domain against the overwritten output.
+    """
+    if type(a) is np.ndarray:
+        return ufunc(a, out=a)
+    return ufunc(a)
+
+
 def _parse_logscale_args(*keys, **kwargs):
     """
     Parse arguments for `LogScale` and `SymmetricalLogScale` that
@@ -81,10 +93,26 @@ class _Scale(object):
         # Pass a dummy axis to the superclass
         axis = type("Axis", (object,), {"axis_name": "x"})()
         super().__init__(axis, *args, **kwargs)
-        self._default_major_locator = mticker.AutoLocator()
-        self._default_minor_locator = mticker.AutoMinorLocator()
-        self._default_major_formatter = pticker.AutoFormatter()
-        self._default_minor_formatter = mticker.NullFormatter()
+
+    # NOTE: Default tickers are built on first access rather than on initialization
+    # since AutoLocator and AutoFormatter read many rc settings and scales are often
+    # constructed without being applied. Subclasses that assign these attributes
+    # in __init__ simply shadow the cached properties.
+    @cached_property
+    def _default_major_locator(self):
+        return mticker.AutoLocator()
+
+    @cached_property
+    def _default_minor_locator(self):
+        return mticker.AutoMinorLocator()
+
+    @cached_property
+    def _default_major_formatter(self):
+        return pticker.AutoFormatter()
+
+    @cached_property
+    def _default_minor_formatter(self):
+        return mticker.NullFormatter()
 
     def set_default_locators_and_formatters(self, axis, only_if_default=False):
         """
@@ -452,6 +480,21 @@ class PowerScale(_Scale, mscale.ScaleBase):
         )
 
 
+def _cube(a):
+    """
+    Return the cube of the input using multiplication.
+    """
+    a = np.asanyarray(a)
+    return a * a * a
+
+
+# Dedicated functions for common exponents. These are much faster than the generic
+# np.power and give the same results up to floating point rounding. Note np.cbrt is
+# omitted because it returns real values for negative inputs where np.power(a, 1 / 3)
+# returns NaN. Also note np.positive is used for the identity to return a new array.
+_POWER_UFUNCS = {0.5: np.sqrt, 1: np.positive, 2: np.square, 3: _cube}
+
+
 class PowerTransform(mtransforms.Transform):
     input_dims = 1
     output_dims = 1
@@ -461,12 +504,15 @@ class PowerTransform(mtransforms.Transform):
     def __init__(self, power):
         super().__init__()
         self._power = power
+        self._ufunc = _POWER_UFUNCS.get(power)
 
     def inverted(self):
         return InvertedPowerTransform(self._power)
 
     def transform_non_affine(self, a):
         with np.errstate(divide="ignore", invalid="ignore"):
+            if self._ufunc is not None:
+                return self._ufunc(a)
             return np.power(a, self._power)
 
 
@@ -479,13 +525,17 @@ class InvertedPowerTransform(mtransforms.Transform):
     def __init__(self, power):
         super().__init__()
         self._power = power
+        self._invpower = 1 / power
+        self._ufunc = _POWER_UFUNCS.get(self._invpower)
 
     def inverted(self):
         return PowerTransform(self._power)
 
     def transform_non_affine(self, a):
         with np.errstate(divide="ignore", invalid="ignore"):
-            return np.power(a, 1 / self._power)
+            if self._ufunc is not None:
+                return self._ufunc(a)
+            return np.power(a, self._invpower)
 
 
 class ExpScale(_Scale, mscale.ScaleBase):
@@ -558,13 +608,17 @@ class ExpTransform(mtransforms.Transform):
         self._a = a
         self._b = b
         self._c = c
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._k = b * np.log(a)  # Ca^(bx) = Ce^(kx)
 
     def inverted(self):
         return InvertedExpTransform(self._a, self._b, self._c)
 
     def transform_non_affine(self, a):
         with np.errstate(divide="ignore", invalid="ignore"):
-            return self._c * np.power(self._a, self._b * np.array(a))
+            aa = np.exp(self._k * np.asarray(a))
+            aa *= self._c
+            return aa
 
 
 class InvertedExpTransform(mtransforms.Transform):
@@ -578,13 +632,17 @@ class InvertedExpTransform(mtransforms.Transform):
         self._a = a
         self._b = b
         self._c = c
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._k = b * np.log(a)  # log_a(x / C) / b = ln(x / C) / k
 
     def inverted(self):
         return ExpTransform(self._a, self._b, self._c)
 
     def transform_non_affine(self, a):
         with np.errstate(divide="ignore", invalid="ignore"):
-            return np.log(a / self._c) / (self._b * np.log(self._a))
+            aa = np.log(np.asanyarray(a) / self._c)
+            aa /= self._k
+            return aa
 
 
 class MercatorLatitudeScale(_Scale, mscale.ScaleBase):
@@ -654,14 +712,18 @@ class MercatorLatitudeTransform(mtransforms.Transform):
         # in limit_range_for_scale or get weird duplicate tick labels. This
         # is not necessary for positive-only scales because it is harder to
         # run up right against the scale boundaries.
+        # NOTE: Only build the masked array when there are invalid values. Masked
+        # operations are much slower and the values are usually in range.
         with np.errstate(divide="ignore", invalid="ignore"):
-            m = ma.masked_where((a <= -90) | (a >= 90), a)
-            if m.mask.any():
-                m = np.deg2rad(m)
-                return ma.log(ma.abs(ma.tan(m) + 1 / ma.cos(m)))
+            # NOTE: Use the identity tan(x) + sec(x) = tan(pi / 4 + x / 2), which is
+            # positive within +/-90 degrees, to avoid the reciprocal and abs.
+            mask = (a <= -90) | (a >= 90)
+            if np.any(mask):
+                m = ma.masked_where(mask, a)
+                return ma.log(ma.tan(m * (np.pi / 360) + np.pi / 4))
             else:
-                a = np.deg2rad(a)
-                return np.log(np.abs(np.tan(a) + 1 / np.cos(a)))
+                aa = a * (np.pi / 360) + np.pi / 4
+                return _apply_inplace(np.log, _apply_inplace(np.tan, aa))
 
 
 class InvertedMercatorLatitudeTransform(mtransforms.Transform):
@@ -679,7 +741,8 @@ class InvertedMercatorLatitudeTransform(mtransforms.Transform):
 
     def transform_non_affine(self, a):
         with np.errstate(divide="ignore", invalid="ignore"):
-            return np.rad2deg(np.arctan2(1, np.sinh(a)))
+            aa = _apply_inplace(np.arctan, np.sinh(a))
+            return _apply_inplace(np.rad2deg, aa)
 
 
 class SineLatitudeScale(_Scale, mscale.ScaleBase):
@@ -737,12 +800,14 @@ class SineLatitudeTransform(mtransforms.Transform):
         # in limit_range_for_scale or get weird duplicate tick labels. This
         # is not necessary for positive-only scales because it is harder to
         # run up right against the scale boundaries.
+        # NOTE: Only build the masked array when there are invalid values. Masked
+        # operations are much slower and the values are usually in range.
         with np.errstate(divide="ignore", invalid="ignore"):
-            m = ma.masked_where((a < -90) | (a > 90), a)
-            if m.mask.any():
-                return ma.sin(np.deg2rad(m))
+            mask = (a < -90) | (a > 90)
+            if np.any(mask):
+                return ma.sin(np.deg2rad(ma.masked_where(mask, a)))
             else:
-                return np.sin(np.deg2rad(a))
+                return _apply_inplace(np.sin, np.deg2rad(a))
 
 
 class InvertedSineLatitudeTransform(mtransforms.Transform):
@@ -759,7 +824,7 @@ class InvertedSineLatitudeTransform(mtransforms.Transform):
 
     def transform_non_affine(self, a):
         with np.errstate(divide="ignore", invalid="ignore"):
-            return np.rad2deg(np.arcsin(a))
+            return _apply_inplace(np.rad2deg, np.arcsin(a))
 
 
 class CutoffScale(_Scale, mscale.ScaleBase):
@@ -848,6 +913,7 @@ class CutoffTransform(mtransforms.Transform):
             if zero_dists is not None:
                 dists[scales[:-1] == 0] = zero_dists
             self._dists = dists
+        self._offsets = np.concatenate(([0], np.cumsum(dists)))
 
     def inverted(self):
         # Use same algorithm for inversion!
@@ -858,18 +924,18 @@ class CutoffTransform(mtransforms.Transform):
         return CutoffTransform(threshs, scales, zero_dists=zero_dists)
 
     def transform_non_affine(self, a):
-        # Cannot do list comprehension because this method sometimes
-        # received non-1D arrays
-        dists = self._dists
+        # NOTE: Values below the first threshold are unchanged. Others are offset
+        # from the transformed position of the nearest threshold below them. The
+        # searchsorted call also works with non-1D arrays.
+        a = np.asarray(a, dtype=float)
         scales = self._scales
         threshs = self._threshs
-        aa = np.array(a)  # copy
+        offsets = self._offsets
+        j = np.searchsorted(threshs, a)
+        k = np.maximum(j - 1, 0)
         with np.errstate(divide="ignore", invalid="ignore"):
-            for i, ai in np.ndenumerate(a):
-                j = np.searchsorted(threshs, ai)
-                if j > 0:
-                    aa[i] = dists[:j].sum() + (ai - threshs[j - 1]) / scales[j - 1]
-        return aa
+            aa = offsets[j] + (a - threshs[k]) / scales[k]
+        return np.where(j > 0, aa, a)
 
 
 class InverseScale(_Scale, mscale.ScaleBase):
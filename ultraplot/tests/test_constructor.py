@@ -1,4 +1,4 @@
-import ultraplot as uplt, pytest
+import numpy as np, ultraplot as uplt, pytest
 
 
 def test_cycler():
@@ -122,3 +122,72 @@ def test_pass_on_cycle():
     for color in colors:
         assert color == active_cycle.get_next()["color"]
         assert color == cycle.get_next()["color"]
+
+
+def test_power_transform_ufuncs():
+    """
+    The power transform fast paths should match np.power.
+    """
+    values = np.array([-4.0, 0.0, 0.25, 4.0, 9.0])
+    for power in (0.5, 1, 2, 3, 4):
+        trans = uplt.Scale("power", power).get_transform()
+        with np.errstate(invalid="ignore"):
+            expected = np.power(values, power)
+            inverse = np.power(values, 1 / power)
+        assert np.allclose(trans.transform_non_affine(values), expected, equal_nan=True)
+        assert np.allclose(
+            trans.inverted().transform_non_affine(values), inverse, equal_nan=True
+        )
+        masked = np.ma.masked_array(np.abs(values), mask=[0, 1, 0, 0, 0])
+        result = trans.transform_non_affine(masked)
+        assert np.array_equal(np.ma.getmaskarray(result), masked.mask)
+
+
+def test_exp_transform():
+    """
+    The exponential transforms should match the direct formulas.
+    """
+    values = np.linspace(0.5, 5, 10)  # positive for inverse presets
+    for preset in ("height", "pressure", "db", "idb", "np", "inp"):
+        trans = uplt.Scale(preset).get_transform()
+        roundtrip = trans.inverted().transform_non_affine(
+            trans.transform_non_affine(values)
+        )
+        assert np.allclose(roundtrip, values)
+    trans = uplt.Scale("exp", 10, 2, 3).get_transform()
+    assert np.allclose(trans.transform_non_affine(values), 3 * 10 ** (2 * values))
+    masked = np.ma.masked_array(values, mask=values > 4)
+    result = trans.inverted().transform_non_affine(masked)
+    assert np.array_equal(np.ma.getmaskarray(result), masked.mask)
+
+
+def test_cutoff_transform():
+    """
+    The vectorized cutoff transform should handle arbitrary array shapes.
+    """
+    trans = uplt.Scale("cutoff", 10, 0.5).get_transform()
+    values = np.array([[5, 10], [12, 20]])
+    result = trans.transform_non_affine(values)
+    assert np.allclose(result, [[5, 10], [14, 30]])
+    assert np.allclose(trans.inverted().transform_non_affine(result), values)
+    assert np.isclose(trans.transform_non_affine(11), 12)
+
+
+def test_latitude_transforms():
+    """
+    The latitude scale inverse transforms should undo the forward transforms.
+    """
+    values = np.array([-80.0, -30.0, 0.0, 45.0, 80.0])
+    for name in ("mercator", "sine"):
+        trans = uplt.Scale(name).get_transform()
+        roundtrip = trans.inverted().transform_non_affine(
+            trans.transform_non_affine(values)
+        )
+        assert np.allclose(roundtrip, values)
+        masked = trans.transform_non_affine(np.ma.masked_array(values))
+        assert not np.any(np.ma.getmaskarray(masked))
+        assert np.allclose(masked, trans.transform_non_affine(values))
+    trans = uplt.Scale("mercator").get_transform()
+    assert np.isclose(trans.transform_non_affine(45.0), np.arcsinh(1))
+    trans = uplt.Scale("sine").get_transform()
+    assert np.isclose(trans.transform_non_affine(30.0), 0.5)
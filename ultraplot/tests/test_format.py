@@ -563,3 +563,76 @@ def test_axis_label_anchor(angle):
         assert tick2.get_rotation() == angle
         assert tick1.get_position()[0] == tick2.get_position()[0]
         assert tick1.get_position()[1] == tick2.get_position()[1]
+
+
+def test_formatter_cache():
+    """
+    Cached tick strings should respect formatter state and minus sign settings.
+    """
+    fig, ax = uplt.subplots()
+    ax.format(xlim=(-1, 1))
+    auto = uplt.ticker.AutoFormatter()
+    auto.set_axis(ax.xaxis)
+    auto.set_locs([-1, 0, 1])
+    for fmt in (auto, uplt.ticker.SimpleFormatter()):
+        with uplt.rc.context({"axes.unicode_minus": True}):
+            assert fmt(-1) == "\N{MINUS SIGN}1"
+            assert fmt(-1) == "\N{MINUS SIGN}1"
+        with uplt.rc.context({"axes.unicode_minus": False}):
+            assert fmt(-1) == "-1"
+    ax.format(xlim=(0, 3e6))
+    auto.set_locs([1e6, 2e6, 3e6])
+    assert auto(2e6) == "2"
+    auto.set_powerlimits((-10, 10))
+    auto.set_locs([1e6, 2e6, 3e6])
+    assert auto(2e6) == "2000000"
+
+
+def test_frac_formatter_cache():
+    """
+    Cached fraction strings should respect the minus sign setting.
+    """
+    fmt = uplt.Formatter("pi")
+    assert fmt(np.pi / 3) == fmt(np.pi / 3) == r"$\pi$/3"
+    with uplt.rc.context({"axes.unicode_minus": False}):
+        assert fmt(-np.pi / 2) == r"-$\pi$/2"
+    with uplt.rc.context({"axes.unicode_minus": True}):
+        assert fmt(-np.pi / 2) == "\N{MINUS SIGN}$\\pi$/2"
+
+
+def test_auto_formatter_format_ticks():
+    """
+    Vectorized tick range masking should match per-tick formatting.
+    """
+    fig, ax = uplt.subplots()
+    fmt = uplt.Formatter("auto", tickrange=(0, 3))
+    fmt.set_axis(ax[0].xaxis)
+    values = [-1, 0, 0.5, 1, 2, 3, 4]
+    labels = fmt.format_ticks(values)
+    assert labels == ["", "0", "0.5", "1", "2", "3", ""]
+    assert labels == [fmt(value, i) for i, value in enumerate(values)]
+
+
+def test_auto_formatter_template():
+    """
+    Copied formatter state should follow the rc settings.
+    """
+    with uplt.rc.context({"axes.formatter.useoffset": False}):
+        assert not uplt.Formatter("auto").get_useOffset()
+    fmt = uplt.Formatter("auto")
+    assert fmt.get_useOffset()
+    fmt.set_powerlimits((-10, 10))
+    assert uplt.Formatter("auto")._powerlimits != fmt._powerlimits
+
+
+def test_formatter_unhashable_input():
+    """
+    Formatters should format unhashable scalars like 0-d arrays without caching.
+    """
+    fig, ax = uplt.subplots()
+    fmt = uplt.Formatter("auto")
+    fmt.set_axis(ax[0].xaxis)
+    fmt.set_locs([0, 1, 2])
+    assert fmt(np.array(1.0)) == fmt(1.0) == "1"
+    assert uplt.Formatter("simple")(np.array(2.5)) == "2.5"
+    assert uplt.Formatter("pi")(np.array(np.pi / 3)) == r"$\pi$/3"
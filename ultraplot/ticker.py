@@ -10,7 +10,7 @@ import matplotlib.axis as maxis
 import matplotlib.ticker as mticker
 import numpy as np
 
-from .config import rc
+from .config import rc, rc_matplotlib
 from .internals import ic  # noqa: F401
 from .internals import _not_none, context, docstring
 
@@ -42,10 +42,24 @@ __all__ = [
     "LatitudeFormatter",
 ]
 
+FORMAT_CACHE_SIZE = 256  # maximum number of cached tick strings per formatter
+MINUS_SIGNS = ("-", "\N{MINUS SIGN}")
 REGEX_ZERO = re.compile("\\A[-\N{MINUS SIGN}]?0(.0*)?\\Z")
-REGEX_MINUS = re.compile("\\A[-\N{MINUS SIGN}]\\Z")
 REGEX_MINUS_ZERO = re.compile("\\A[-\N{MINUS SIGN}]0(.0*)?\\Z")
 
+# Settings that determine the initial ScalarFormatter state and templates
+# for copying that state to new AutoFormatter instances
+SCALAR_TEMPLATE_KEYS = (
+    "axes.formatter.limits",
+    "axes.formatter.offset_threshold",
+    "axes.formatter.use_locale",
+    "axes.formatter.use_mathtext",
+    "axes.formatter.useoffset",
+    "font.family",
+    "text.usetex",
+)
+SCALAR_TEMPLATES = {}
+
 _precision_docstring = """
 precision : int, default: {6, 2}
     The maximum number of digits after the decimal point. Default is ``6``
@@ -391,7 +405,10 @@ class AutoFormatter(mticker.ScalarFormatter):
         therefore use `AutoFormatter` with every axis scale by default.
         """
         tickrange = tickrange or (-np.inf, np.inf)
-        super().__init__(**kwargs)
+        if kwargs:
+            super().__init__(**kwargs)
+        else:  # copy state of identically configured formatter
+            self.__dict__.update(self._get_template().__dict__)
         zerotrim = _not_none(zerotrim, rc["formatter.zerotrim"])
         self._zerotrim = zerotrim
         self._tickrange = tickrange
@@ -399,12 +416,73 @@ class AutoFormatter(mticker.ScalarFormatter):
         self._prefix = prefix or ""
         self._suffix = suffix or ""
         self._negpos = negpos or ""
+        self._cache = {}
 
     @docstring._snippet_manager
     def __call__(self, x, pos=None):
         """
         %(ticker.call)s
         """
+        # Look up string from previous draws
+        # NOTE: Position is ignored by both this and the parent formatter.
+        return self._cached_value(x, pos, self._get_cache_state())
+
+    def format_ticks(self, values):
+        """
+        Return the tick labels for all ticks at once. Ticks outside of the
+        tick range are masked with a single array operation and skipped, and
+        the formatter state used for the string cache is only read once.
+        """
+        self.set_locs(values)
+        array = np.asarray(values, dtype=float)
+        array = self._wrap_tick_range(array, self._wraprange)
+        eps = np.abs(array) / 1000
+        outside = (array + eps < self._tickrange[0]) | (
+            array - eps > self._tickrange[1]
+        )
+        state = self._get_cache_state()
+        return [
+            "" if outside[i] else self._cached_value(value, i, state)
+            for i, value in enumerate(values)
+        ]
+
+    def _get_cache_state(self):
+        """
+        Return the scalar formatter state and global minus sign settings
+        that affect the tick strings.
+        """
+        return (
+            len(self.locs) > 0,
+            self.offset,
+            self.orderOfMagnitude,
+            self.format,
+            self.get_useMathText(),
+            self.get_useLocale(),
+            self._get_decimal_point(),
+            rc_matplotlib["axes.unicode_minus"],
+            rc_matplotlib["text.usetex"],
+        )
+
+    def _cached_value(self, x, pos, state):
+        """
+        Convert number to a string using the cache.
+        """
+        key = (x, state)
+        try:
+            string = self._cache.get(key)
+        except TypeError:  # unhashable input, e.g. 0-d or masked arrays
+            return self._format_value(x, pos)
+        if string is None:
+            string = self._format_value(x, pos)
+            if len(self._cache) >= FORMAT_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[key] = string
+        return string
+
+    def _format_value(self, x, pos=None):
+        """
+        Convert number to a string without caching.
+        """
         # Tick range limitation
         x = self._wrap_tick_range(x, self._wraprange)
         if self._outside_tick_range(x, self._tickrange):
@@ -429,6 +507,21 @@ class AutoFormatter(mticker.ScalarFormatter):
         string = string + tail  # add negative-positive indicator
         return string
 
+    @staticmethod
+    def _get_template():
+        """
+        Return a default `~matplotlib.ticker.ScalarFormatter` for the current
+        settings. The initial state only depends on the rc settings read below.
+        """
+        # NOTE: ScalarFormatter initialization is slow because it looks up the
+        # font when axes.formatter.use_mathtext is False. Since the state is
+        # fully determined by these settings we can copy it to new instances.
+        key = tuple(str(rc_matplotlib[key]) for key in SCALAR_TEMPLATE_KEYS)
+        template = SCALAR_TEMPLATES.get(key)
+        if template is None:
+            template = SCALAR_TEMPLATES[key] = mticker.ScalarFormatter()
+        return template
+
     def get_offset(self):
         """
         Get the offset but *always* use math text.
@@ -444,7 +537,7 @@ class AutoFormatter(mticker.ScalarFormatter):
         sign = ""
         prefix = prefix or ""
         suffix = suffix or ""
-        if string and REGEX_MINUS.match(string[0]):
+        if string.startswith(MINUS_SIGNS):
             sign, string = string[0], string[1:]
         return sign + prefix + string + suffix
 
@@ -515,9 +608,9 @@ class AutoFormatter(mticker.ScalarFormatter):
         """
         Format the minus sign and avoid "negative zero," e.g. ``-0.000``.
         """
-        if rc["axes.unicode_minus"] and not rc["text.usetex"]:
+        if rc_matplotlib["axes.unicode_minus"] and not rc_matplotlib["text.usetex"]:
             string = string.replace("-", "\N{MINUS SIGN}")
-        if REGEX_MINUS_ZERO.match(string):
+        if string.startswith(MINUS_SIGNS) and REGEX_MINUS_ZERO.match(string):
             string = string[1:]
         return string
 
@@ -611,12 +704,36 @@ class SimpleFormatter(mticker.Formatter):
         self._tickrange = tickrange or (-np.inf, np.inf)
         self._wraprange = wraprange
         self._zerotrim = zerotrim
+        self._cache = {}
 
     @docstring._snippet_manager
     def __call__(self, x, pos=None):  # noqa: U100
         """
         %(ticker.call)s
         """
+        # Look up string from previous draws
+        decimal_point = AutoFormatter._get_default_decimal_point()
+        key = (
+            x,
+            decimal_point,
+            rc_matplotlib["axes.unicode_minus"],
+            rc_matplotlib["text.usetex"],
+        )
+        try:
+            string = self._cache.get(key)
+        except TypeError:  # unhashable input, e.g. 0-d or masked arrays
+            return self._format_value(x, decimal_point)
+        if string is None:
+            string = self._format_value(x, decimal_point)
+            if len(self._cache) >= FORMAT_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[key] = string
+        return string
+
+    def _format_value(self, x, decimal_point="."):
+        """
+        Convert number to a string without caching.
+        """
         # Tick range limitation
         x = AutoFormatter._wrap_tick_range(x, self._wraprange)
         if AutoFormatter._outside_tick_range(x, self._tickrange):
@@ -628,7 +745,6 @@ class SimpleFormatter(mticker.Formatter):
         )
 
         # Default string formatting
-        decimal_point = AutoFormatter._get_default_decimal_point()
         string = ("{:.%df}" % self._precision).format(x)
         string = string.replace(".", decimal_point)
 
@@ -793,6 +909,7 @@ class FracFormatter(mticker.Formatter):
         """
         self._symbol = symbol
         self._number = number
+        self._cache = {}
         super().__init__()
 
     @docstring._snippet_manager
@@ -800,6 +917,23 @@ class FracFormatter(mticker.Formatter):
         """
         %(ticker.call)s
         """
+        # Look up string from previous draws to skip the fraction conversion
+        key = (x, rc_matplotlib["axes.unicode_minus"], rc_matplotlib["text.usetex"])
+        try:
+            string = self._cache.get(key)
+        except TypeError:  # unhashable input, e.g. 0-d arrays
+            return self._format_value(x)
+        if string is None:
+            string = self._format_value(x)
+            if len(self._cache) >= FORMAT_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[key] = string
+        return string
+
+    def _format_value(self, x):
+        """
+        Convert number to a string without caching.
+        """
         frac = Fraction(x / self._number).limit_denominator()
         symbol = self._symbol
         if x == 0:
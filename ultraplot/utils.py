@@ -831,6 +831,14 @@ def units(
         Whether to use the width or height for the axes and figure
         relative coordinates.
     """
+    # Fast path for numbers that are already in the destination units
+    if (
+        isinstance(value, Real)
+        and (numeric is None or numeric in UNIT_DICT)
+        and (dest is None or dest == numeric)
+    ):
+        return float(value)
+
     # Scales for converting physical units to inches
     fontsize_small = _not_none(fontsize, rc_matplotlib["font.size"])  # always absolute
     fontsize_small = _fontsize_to_pt(fontsize_small)